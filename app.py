@@ -1,10 +1,155 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, g, request, jsonify, render_template, stream_with_context
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import or_
+from sqlalchemy import event, func, or_, select, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Optional
+import itertools
+import numpy as np
+import orjson
 import os
 import random
-from uuid import uuid4
+import re
+import secrets
+import sys
+
+
+@dataclass(slots=True)
+class ProductRow:
+    """Read-side product record; a plain slotted object instead of an instrumented ORM instance."""
+    id: int
+    name: str
+    description: str
+    category: str
+    brand: str
+    price: float
+    stock: int
+    sku: str
+
+
+# Column order of product rows as returned by the read endpoints
+PRODUCT_FIELDS = tuple(field.name for field in fields(ProductRow))
+
+# Bound to each app in create_app via init_app, so the model and its mapper are defined once.
+# Writes go through Core and nothing reads ORM instances back, so skip autoflush checks and
+# post-commit expiry
+db = SQLAlchemy(session_options={'expire_on_commit': False, 'autoflush': False})
+
+
+class Product(db.Model):
+    __tablename__ = 'products'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(120), nullable=False)
+    description = db.Column(db.String(500), nullable=False)
+    category = db.Column(db.String(80), nullable=False)
+    brand = db.Column(db.String(80), nullable=False)
+    price = db.Column(db.Float, nullable=False)
+    stock = db.Column(db.Integer, nullable=False)
+    sku = db.Column(db.String(40), unique=True, nullable=False)
+
+    # Expression indexes so case-insensitive prefix lookups (lower(col) GLOB 'term*') can seek
+    __table_args__ = (
+        db.Index('ix_products_name_lower', func.lower(name)),
+        db.Index('ix_products_brand_lower', func.lower(brand)),
+        db.Index('ix_products_category_lower', func.lower(category)),
+        db.Index('ix_products_sku_lower', func.lower(sku)),
+    )
+
+
+# Single-row counter bumped in the same transaction as every catalog write. Readers compare it
+# against what their in-process memos were built from, so writes by any process invalidate them.
+catalog_meta = db.Table(
+    'catalog_meta',
+    db.Column('id', db.Integer, primary_key=True),
+    db.Column('version', db.Integer, nullable=False),
+)
+
+
+# SKUs are a per-process random prefix plus a counter: unique within the process without
+# drawing entropy per row, and the prefix keeps separate runs against one database apart
+_SKU_PREFIX = secrets.token_hex(4).upper()
+_sku_numbers = itertools.count(1)
+
+# Constant response bodies, encoded once at import
+_HEALTH_BYTES = b'{"status":"ok"}'
+_EMPTY_SEARCH = orjson.dumps({'items': [], 'page': 1, 'total': 0, 'next_cursor': None})
+
+# Applied to every new SQLite connection: WAL with relaxed fsync for cheap commits,
+# a 64 MiB page cache and 256 MiB of memory-mapped I/O for the read endpoints
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# External-content FTS5 index over the searchable product columns. The
+# triggers keep it in sync with `products`, so writers never touch it directly.
+FTS_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE products_fts USING fts5("
+    "name, description, category, brand, sku, "
+    "content='products', content_rowid='id', tokenize='unicode61')"
+)
+FTS_TRIGGERS_DDL = (
+    """CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+        INSERT INTO products_fts(rowid, name, description, category, brand, sku)
+        VALUES (new.id, new.name, new.description, new.category, new.brand, new.sku);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, description, category, brand, sku)
+        VALUES ('delete', old.id, old.name, old.description, old.category, old.brand, old.sku);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, description, category, brand, sku)
+        VALUES ('delete', old.id, old.name, old.description, old.category, old.brand, old.sku);
+        INSERT INTO products_fts(rowid, name, description, category, brand, sku)
+        VALUES (new.id, new.name, new.description, new.category, new.brand, new.sku);
+    END""",
+)
+
+
+def _setup_fts(db) -> bool:
+    """Create the FTS5 index and sync triggers; return False if FTS5 is unavailable."""
+    if db.engine.dialect.name != 'sqlite':
+        return False
+    exists = db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'products_fts'")
+    ).first()
+    try:
+        if not exists:
+            db.session.execute(text(FTS_TABLE_DDL))
+            # Index rows written before the FTS table existed
+            db.session.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
+        for ddl in FTS_TRIGGERS_DDL:
+            db.session.execute(text(ddl))
+        db.session.commit()
+    except OperationalError:
+        db.session.rollback()
+        return False
+    return True
+
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+@lru_cache(maxsize=128)
+def _match_expression(term: str) -> Optional[str]:
+    """Turn a free-text term into an FTS5 prefix query, e.g. 'Acm lamp' -> 'acm* OR lamp*'."""
+    tokens = _TOKEN_RE.findall(term.lower())
+    return ' OR '.join(f"{token}*" for token in tokens) if tokens else None
 
 
 def create_app(testing: bool = False, database_uri: Optional[str] = None):
@@ -19,38 +164,38 @@ def create_app(testing: bool = False, database_uri: Optional[str] = None):
     app.config['SQLALCHEMY_DATABASE_URI'] = db_path
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-    db = SQLAlchemy(app)
-
-    class Product(db.Model):
-        __tablename__ = 'products'
-        id = db.Column(db.Integer, primary_key=True)
-        name = db.Column(db.String(120), nullable=False)
-        description = db.Column(db.String(500), nullable=False)
-        category = db.Column(db.String(80), nullable=False)
-        brand = db.Column(db.String(80), nullable=False)
-        price = db.Column(db.Float, nullable=False)
-        stock = db.Column(db.Integer, nullable=False)
-        sku = db.Column(db.String(40), unique=True, nullable=False)
-
-        def to_dict(self):
-            return {
-                'id': self.id,
-                'name': self.name,
-                'description': self.description,
-                'category': self.category,
-                'brand': self.brand,
-                'price': self.price,
-                'stock': self.stock,
-                'sku': self.sku,
-            }
+    # Catalogs up to this many rows have list pages served from an in-memory snapshot and
+    # substring searches answered by an in-memory trigram index
+    app.config['CATALOG_SNAPSHOT_MAX'] = 2000
+
+    cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 60})
+    db.init_app(app)
 
     # Ensure tables exist
     with app.app_context():
+        engine = db.engine
+        if engine.dialect.name == 'sqlite' and engine.url.database not in (None, '', ':memory:'):
+            event.listen(engine, 'connect', _apply_sqlite_pragmas)
         db.create_all()
+        # create_all only builds indexes alongside new tables; add any missing ones to existing databases
+        for index in Product.__table__.indexes:
+            db.session.execute(CreateIndex(index, if_not_exists=True))
+        # OR IGNORE so workers starting together against a fresh database don't race on the seed row
+        db.session.execute(catalog_meta.insert().prefix_with('OR IGNORE').values(id=1, version=0))
+        db.session.commit()
+        has_fts = _setup_fts(db)
 
     # Utilities
     MAX_PAGE_SIZE = 200
     MAX_GENERATE_COUNT = 2000
+    # List pages larger than this are streamed, fetching STREAM_BATCH_SIZE rows at a time
+    STREAM_PAGE_SIZE = 100
+    STREAM_BATCH_SIZE = 64
+    # Inclusive (min, max) bounds; page is capped so the OFFSET stays within SQLite's 64-bit integers
+    PAGE_RANGE = (1, sys.maxsize // MAX_PAGE_SIZE)
+    LIMIT_RANGE = (1, MAX_PAGE_SIZE)
+    COUNT_RANGE = (1, MAX_GENERATE_COUNT)
+    CURSOR_RANGE = (0, sys.maxsize)
 
     adjectives = [
         'Compact', 'Wireless', 'Durable', 'Premium', 'Eco', 'Smart', 'Portable', 'Ultra', 'Classic', 'Hybrid'
@@ -71,35 +216,174 @@ def create_app(testing: bool = False, database_uri: Optional[str] = None):
         'Includes extended battery life'
     ]
 
-    def random_product_name():
-        return f"{random.choice(adjectives)} {random.choice(nouns)}"
+    features = ['sleek design', 'advanced sensors', 'quick setup', 'modern styling', 'quiet operation']
+    categories = ['Electronics', 'Home', 'Sports', 'Toys', 'Books']
+    brands = ['Acme', 'Globex', 'Umbrella', 'Soylent', 'Initech']
 
-    def random_sentence():
-        return f"{random.choice(benefits)} with {random.choice(['sleek design', 'advanced sensors', 'quick setup', 'modern styling', 'quiet operation'])}."
+    # Every possible name and description, formatted once; generation just indexes into these
+    name_pool = [f"{brand} {adjective} {noun}" for brand in brands for adjective in adjectives for noun in nouns]
+    description_pool = [f"{benefit} with {feature}." for benefit in benefits for feature in features]
 
     @app.route('/health')
     def health():
-        return jsonify({'status': 'ok'})
+        return app.response_class(_HEALTH_BYTES, mimetype='application/json')
 
-    def _int_or_error(value, field, minimum=1, maximum=None):
-        try:
+    def _parse_bounded(value, field, bounds):
+        # Plain digit strings and ints skip int()'s general parser and the try/except
+        if type(value) is str and value.isdigit() and value.isascii():
             value = int(value)
-        except (TypeError, ValueError):
-            raise ValueError(f"{field} must be an integer")
-        if minimum is not None and value < minimum:
+        elif type(value) is not int:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{field} must be an integer") from None
+        minimum, maximum = bounds
+        if minimum <= value <= maximum:
+            return value
+        if value < minimum:
             raise ValueError(f"{field} must be >= {minimum}")
-        if maximum is not None and value > maximum:
-            raise ValueError(f"{field} must be <= {maximum}")
-        return value
+        raise ValueError(f"{field} must be <= {maximum}")
 
-    def _paginate_query(query):
-        try:
-            page = _int_or_error(request.args.get('page', 1), 'page', minimum=1)
-            limit = _int_or_error(request.args.get('limit', 50), 'limit', minimum=1, maximum=MAX_PAGE_SIZE)
-        except ValueError as exc:
-            return None, None, (jsonify({'error': str(exc)}), 400)
-        pagination = query.paginate(page=page, per_page=limit, error_out=False)
-        return pagination, page, limit
+    def _page_and_limit():
+        args = request.args
+        page = _parse_bounded(args.get('page', 1), 'page', PAGE_RANGE)
+        limit = _parse_bounded(args.get('limit', 50), 'limit', LIMIT_RANGE)
+        return page, limit
+
+    products_table = Product.__table__
+    product_columns = [products_table.c[field] for field in PRODUCT_FIELDS]
+
+    def _select_products():
+        return select(*product_columns)
+
+    def _fetch_rows(stmt):
+        # Plain tuples into slotted rows; skips ORM hydration, and orjson encodes dataclasses natively
+        return [ProductRow(*row) for row in db.session.execute(stmt)]
+
+    def _json_response(payload):
+        return app.response_class(orjson.dumps(payload), mimetype='application/json')
+
+    def _catalog_version():
+        # Read once per request; a primary-key lookup that sees writes from every process
+        if 'catalog_version' not in g:
+            g.catalog_version = db.session.execute(select(catalog_meta.c.version)).scalar_one()
+        return g.catalog_version
+
+    # count key -> (catalog version, total); an entry is recomputed once the version moves on
+    count_cache = {}
+
+    def _count_total(count_stmt, count_key):
+        version = _catalog_version()
+        cached = count_cache.get(count_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        total = db.session.execute(count_stmt).scalar()
+        count_cache[count_key] = (version, total)
+        return total
+
+    def _stream_page(stmt, page, total):
+        # Encode and send rows in cursor-sized batches instead of building the whole page first
+        def generate():
+            yield b'{"items":['
+            separator = b''
+            result = db.session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+            for batch in result.partitions():
+                yield separator + b','.join(orjson.dumps(ProductRow(*row)) for row in batch)
+                separator = b','
+            yield b'],"page":%d,"total":%d}' % (page, total)
+
+        return app.response_class(stream_with_context(generate()), mimetype='application/json')
+
+    @lru_cache(maxsize=128)
+    def _fts_ids(version, match, after_id, limit, offset):
+        # Keyed on the normalized MATCH expression, so 'Acme', 'acme ' and 'ACME' share one entry;
+        # `version` comes from catalog_meta, so a write by any process retires entries
+        return tuple(db.session.execute(
+            text(
+                "SELECT rowid FROM products_fts WHERE products_fts MATCH :m AND rowid > :after "
+                "ORDER BY rowid LIMIT :lim OFFSET :off"
+            ),
+            {'m': match, 'after': after_id, 'lim': limit, 'off': offset},
+        ).scalars())
+
+    def _search_condition(kind, needle):
+        c = products_table.c
+        if kind == 'prefix':
+            # Single bare token: prefix match on the short columns via their lower() indexes
+            prefix = f"{needle}*"
+            return or_(
+                func.lower(c.name).op('GLOB')(prefix),
+                func.lower(c.brand).op('GLOB')(prefix),
+                func.lower(c.category).op('GLOB')(prefix),
+                func.lower(c.sku).op('GLOB')(prefix)
+            )
+        like = f"%{needle}%"
+        if kind == 'like':
+            # Phrases and wildcards when FTS5 is unavailable or the term has no indexable tokens
+            return or_(
+                c.name.ilike(like),
+                c.description.ilike(like),
+                c.category.ilike(like),
+                c.brand.ilike(like),
+                c.sku.ilike(like)
+            )
+        # 'substring': inside-word matches on the short columns, for catalogs too big for the trigram index
+        return or_(c.name.ilike(like), c.category.ilike(like), c.brand.ilike(like), c.sku.ilike(like))
+
+    @lru_cache(maxsize=256)
+    def _search_total(version, kind, needle):
+        # Totals depend only on the query, not the page, so every page and cursor step of a search
+        # shares one count per catalog version
+        if kind == 'fts':
+            return db.session.execute(
+                text("SELECT count(*) FROM products_fts WHERE products_fts MATCH :m"), {'m': needle}
+            ).scalar()
+        condition = _search_condition(kind, needle)
+        return db.session.execute(select(func.count()).select_from(products_table).where(condition)).scalar()
+
+    @lru_cache(maxsize=1)
+    def _trigram_index(version):
+        """Return (trigram -> product ids, product id -> lowercased fields) over name/brand/category/sku."""
+        # One table scan the first time a substring search needs it for this catalog version
+        c = products_table.c
+        trigrams = defaultdict(set)
+        texts = {}
+        for pid, *values in db.session.execute(select(c.id, c.name, c.brand, c.category, c.sku)):
+            lowered = tuple(value.lower() for value in values)
+            texts[pid] = lowered
+            for value in lowered:
+                for i in range(len(value) - 2):
+                    trigrams[value[i:i + 3]].add(pid)
+        return trigrams, texts
+
+    @lru_cache(maxsize=128)
+    def _substring_ids(version, max_rows, needle):
+        # Intersect the posting sets of the needle's trigrams, then drop false positives whose
+        # trigrams occur in the right fields but not contiguously. Catalogs above max_rows get no
+        # index (None) so a miss can't trigger an unbounded scan-and-build; callers use LIKE instead.
+        if _count_total(select(func.count()).select_from(products_table), 'products') > max_rows:
+            return None
+        trigrams, texts = _trigram_index(version)
+        postings = sorted((trigrams.get(needle[i:i + 3], set()) for i in range(len(needle) - 2)), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return tuple(sorted(pid for pid in candidates if any(needle in value for value in texts[pid])))
+
+    @lru_cache(maxsize=1)
+    def _catalog_snapshot(version, max_rows):
+        """Return every product row, ordered by id, for catalogs of at most max_rows; otherwise None."""
+        # Built once per catalog version, so list pages are slices without a round trip to SQLite
+        total = _count_total(select(func.count()).select_from(products_table), 'products')
+        if total > max_rows:
+            return None
+        return _fetch_rows(_select_products().order_by(products_table.c.id.asc()))
+
+    def _cache_key():
+        return f"v{_catalog_version()}:{request.full_path}"
+
+    def _cacheable(response):
+        # Error paths return (response, status) tuples and streamed bodies can't be stored;
+        # only complete successful responses are cached
+        return getattr(response, 'status_code', None) == 200 and not response.is_streamed
 
     def _json_error(message, status=400):
         return jsonify({'error': message}), status
@@ -111,67 +395,133 @@ def create_app(testing: bool = False, database_uri: Optional[str] = None):
         random.seed(body.get('seed'))
 
         try:
-            count = _int_or_error(count_raw, 'count', minimum=1, maximum=MAX_GENERATE_COUNT)
+            count = _parse_bounded(count_raw, 'count', COUNT_RANGE)
         except ValueError as exc:
             return _json_error(str(exc))
 
-        categories = ['Electronics', 'Home', 'Sports', 'Toys', 'Books']
-        brands = ['Acme', 'Globex', 'Umbrella', 'Soylent', 'Initech']
-
-        created = []
-        for i in range(count):
-            p = Product(
-                name=f"{random.choice(brands)} {random_product_name()}",
-                description=random_sentence(),
-                category=random.choice(categories),
-                brand=random.choice(brands),
-                price=round(random.uniform(5, 999), 2),
-                stock=random.randint(0, 500),
-                sku=f"SKU-{uuid4().hex[:10].upper()}"
-            )
-            db.session.add(p)
-            created.append(p)
+        # Draw each attribute for the whole batch at once rather than per row
+        row_categories = random.choices(categories, k=count)
+        row_brands = random.choices(brands, k=count)
+        # The rest come from a NumPy generator seeded off `random`, so `seed` still makes runs repeatable
+        rng = np.random.default_rng(random.getrandbits(64))
+        name_idx = rng.integers(0, len(name_pool), count).tolist()
+        description_idx = rng.integers(0, len(description_pool), count).tolist()
+        prices = np.round(rng.uniform(5, 999, count), 2).tolist()
+        stocks = rng.integers(0, 501, count).tolist()
+
+        rows = [
+            {
+                'name': name_pool[name_idx[i]],
+                'description': description_pool[description_idx[i]],
+                'category': row_categories[i],
+                'brand': row_brands[i],
+                'price': prices[i],
+                'stock': stocks[i],
+                'sku': f"SKU-{_SKU_PREFIX}-{sku_number:08d}",
+            }
+            for i, sku_number in zip(range(count), _sku_numbers)
+        ]
+        # One executemany through Core instead of per-object ORM flushes
+        db.session.execute(products_table.insert(), rows)
+        db.session.execute(update(catalog_meta).values(version=catalog_meta.c.version + 1))
         db.session.commit()
-        return jsonify({'created': len(created)})
+        return jsonify({'created': len(rows)})
 
     @app.route('/products', methods=['GET'])
+    @cache.cached(make_cache_key=_cache_key, response_filter=_cacheable)
     def list_products():
-        pagination, page, limit_or_error = _paginate_query(Product.query.order_by(Product.id.asc()))
-        if pagination is None:
-            return limit_or_error  # contains error response tuple
+        try:
+            page, limit = _page_and_limit()
+        except ValueError as exc:
+            return _json_error(str(exc))
 
-        return jsonify({
-            'items': [p.to_dict() for p in pagination.items],
+        rows = _catalog_snapshot(_catalog_version(), app.config['CATALOG_SNAPSHOT_MAX'])
+        if rows is not None:
+            return _json_response({'items': rows[(page - 1) * limit:page * limit], 'page': page, 'total': len(rows)})
+
+        total = _count_total(select(func.count()).select_from(products_table), 'products')
+        stmt = _select_products().order_by(products_table.c.id.asc()).limit(limit).offset((page - 1) * limit)
+        if limit > STREAM_PAGE_SIZE:
+            return _stream_page(stmt, page, total)
+
+        return _json_response({
+            'items': _fetch_rows(stmt),
             'page': page,
-            'total': pagination.total
+            'total': total
         })
 
     @app.route('/products/search', methods=['GET'])
+    @cache.cached(make_cache_key=_cache_key, response_filter=_cacheable)
     def search_products():
         term = (request.args.get('q') or '').strip()
         if not term:
             return _json_error('Query parameter q is required')
-        like = f"%{term}%"
-        query = Product.query.filter(
-            or_(
-                Product.name.ilike(like),
-                Product.description.ilike(like),
-                Product.category.ilike(like),
-                Product.brand.ilike(like),
-                Product.sku.ilike(like)
+        try:
+            page, limit = _page_and_limit()
+            cursor = request.args.get('cursor')
+            if cursor is not None:
+                cursor = _parse_bounded(cursor, 'cursor', CURSOR_RANGE)
+        except ValueError as exc:
+            return _json_error(str(exc))
+
+        # Keyset pagination: with a cursor, seek past the last seen id instead of skipping OFFSET rows
+        after_id = cursor or 0
+        offset = 0 if cursor is not None else (page - 1) * limit
+
+        c = products_table.c
+        version = _catalog_version()
+        match = _match_expression(term)
+        ids = None
+        if has_fts and match:
+            total = _search_total(version, 'fts', match)
+            ids = _fts_ids(version, match, after_id, limit, offset) if total else ()
+        else:
+            kind = 'prefix' if term.isalnum() else 'like'
+            condition = _search_condition(kind, term.lower())
+            total = _search_total(version, kind, term.lower())
+
+        if not total and len(term) >= 3:
+            # Prefix matching found nothing; look for the term inside words instead ('cme' -> 'Acme')
+            matched = _substring_ids(version, app.config['CATALOG_SNAPSHOT_MAX'], term.lower())
+            if matched is not None:
+                total = len(matched)
+                ids = [pid for pid in matched if pid > after_id][offset:offset + limit]
+            else:
+                condition = _search_condition('substring', term.lower())
+                total = _search_total(version, 'substring', term.lower())
+                ids = None
+
+        if not total and page == 1:
+            return app.response_class(_EMPTY_SEARCH, mimetype='application/json')
+        if ids is not None:
+            items = _fetch_rows(
+                _select_products().where(c.id.in_(ids)).order_by(c.id.asc())
+            ) if ids else []
+        else:
+            items = _fetch_rows(
+                _select_products().where(condition, c.id > after_id)
+                .order_by(c.id.asc()).limit(limit).offset(offset)
             )
-        ).order_by(Product.id.asc())
-        pagination, page, limit_or_error = _paginate_query(query)
-        if pagination is None:
-            return limit_or_error
-        return jsonify({'items': [p.to_dict() for p in pagination.items], 'page': page, 'total': pagination.total})
+
+        next_cursor = items[-1].id if len(items) == limit else None
+        return _json_response({'items': items, 'page': page, 'total': total, 'next_cursor': next_cursor})
+
+    # The demo page has no per-request context, so render it once up front
+    with app.app_context():
+        index_html = render_template('index.html').encode('utf-8')
 
     @app.route('/')
     def index():
-        return render_template('index.html')
+        if app.debug:
+            # Keep template edits visible while developing
+            return render_template('index.html')
+        response = app.response_class(index_html, mimetype='text/html')
+        response.headers['Cache-Control'] = 'public, max-age=300'
+        return response
 
     # Expose for tests
     app.db = db
+    app.cache = cache
     app.Product = Product
     return app
 
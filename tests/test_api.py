@@ -1,7 +1,10 @@
+import re
 import sys
 from pathlib import Path
 
 import pytest
+from flask import render_template
+from sqlalchemy import event
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -75,12 +78,25 @@ def test_pagination_boundaries_and_validation(client):
     assert client.get('/products?page=0').status_code == 400
     assert client.get('/products?limit=0').status_code == 400
 
+    # page is capped so OFFSET fits in SQLite's 64-bit integers
+    res = client.get(f'/products?page={sys.maxsize // 200 + 1}')
+    assert res.status_code == 400
+    assert res.get_json()['error'] == f'page must be <= {sys.maxsize // 200}'
+
+    # Non-ASCII decimal digits are still accepted through int(), as before the digit fast path
+    res = client.get('/products?limit=\u0663')
+    assert res.status_code == 200
+    assert len(res.get_json()['items']) == 3
+
 
 def test_input_validation_errors(client):
     assert client.post('/products/generate', json={'count': -5}).status_code == 400
     assert client.post('/products/generate', json={'count': 0}).status_code == 400
     assert client.post('/products/generate', json={'count': 2500}).status_code == 400
     assert client.post('/products/generate', json={'count': 'abc'}).status_code == 400
+    res = client.post('/products/generate', json={'count': '5'})
+    assert res.status_code == 200
+    assert res.get_json()['created'] == 5
 
     assert client.get('/products?limit=500').status_code == 400
     resp = client.get('/products/search?q=')
@@ -125,3 +141,200 @@ def test_invalid_search_params(client):
     client.post('/products/generate', json={'count': 10})
     assert client.get('/products/search?q=Ac&page=0').status_code == 400
     assert client.get('/products/search?q=Ac&limit=0').status_code == 400
+
+
+def test_search_matches_word_prefixes_across_fields(client):
+    client.post('/products/generate', json={'count': 50, 'seed': 7})
+    items = _fetch_all_products(client, limit=50)
+
+    noun = items[0]['name'].split()[-1]
+    res = client.get(f'/products/search?q={noun[:4].lower()}&limit=50')
+    data = res.get_json()
+    expected = [it['id'] for it in items if any(
+        word.lower().startswith(noun[:4].lower())
+        for field in ('name', 'description', 'category', 'brand', 'sku')
+        for word in re.split(r'[^A-Za-z0-9]+', it[field])
+    )]
+    assert data['total'] == len(expected)
+    assert [it['id'] for it in data['items']] == expected
+
+
+def test_search_without_fts_uses_prefix_match(tmp_path, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setattr(app_module, '_setup_fts', lambda db: False)
+    application = create_app(database_uri=f"sqlite:///{tmp_path/'nofts.db'}")
+    client = application.test_client()
+    client.post('/products/generate', json={'count': 40, 'seed': 3})
+    items = _fetch_all_products(client, limit=50)
+
+    brand = items[0]['brand']
+    data = client.get(f'/products/search?q={brand[:3].lower()}&limit=50').get_json()
+    expected = [it['id'] for it in items if any(
+        it[field].lower().startswith(brand[:3].lower()) for field in ('name', 'brand', 'category', 'sku')
+    )]
+    assert data['total'] == len(expected)
+    assert [it['id'] for it in data['items']] == expected
+
+
+def _offset_walk(client, query, limit):
+    ids = []
+    page = 1
+    while True:
+        data = client.get(f'/products/search?{query}&limit={limit}&page={page}').get_json()
+        if not data['items']:
+            return ids
+        ids.extend(it['id'] for it in data['items'])
+        page += 1
+
+
+def _cursor_walk(app, client, query, limit):
+    """Follow next_cursor to the end; return (ids, first-page total, COUNT queries issued)."""
+    count_queries = []
+
+    def record(conn, cursor, statement, *args):
+        if 'count(' in statement.lower():
+            count_queries.append(statement)
+
+    with app.app_context():
+        engine = app.db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        data = client.get(f'/products/search?{query}&limit={limit}').get_json()
+        total = data['total']
+        ids = [it['id'] for it in data['items']]
+        while data['next_cursor'] is not None:
+            data = client.get(f"/products/search?{query}&limit={limit}&cursor={data['next_cursor']}").get_json()
+            ids.extend(it['id'] for it in data['items'])
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    return ids, total, len(count_queries)
+
+
+def test_search_cursor_pagination_matches_offset_pages(client, app):
+    client.post('/products/generate', json={'count': 120, 'seed': 5})
+
+    offset_ids = _offset_walk(client, 'q=sku', 25)
+    cursor_ids, total, count_queries = _cursor_walk(app, client, 'q=sku', 25)
+
+    assert total == 120
+    assert cursor_ids == offset_ids
+    assert len(cursor_ids) == 120
+    # The offset walk already counted this query; cursor pages reuse that total
+    assert count_queries == 0
+    assert client.get('/products/search?q=sku&cursor=-1').status_code == 400
+
+
+def test_search_cursor_pagination_without_fts(tmp_path, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setattr(app_module, '_setup_fts', lambda db: False)
+    application = create_app(database_uri=f"sqlite:///{tmp_path/'nofts.db'}")
+    client = application.test_client()
+    client.post('/products/generate', json={'count': 120, 'seed': 5})
+
+    for query in ('q=sku', 'q=sku-'):  # GLOB prefix path, then the LIKE path
+        cursor_ids, total, count_queries = _cursor_walk(application, client, query, 25)
+        assert total == 120
+        assert count_queries == 1
+        assert cursor_ids == _offset_walk(client, query, 25)
+        assert len(cursor_ids) == 120
+
+
+def test_cached_reads_are_invalidated_by_generate(client, app):
+    client.post('/products/generate', json={'count': 10, 'seed': 1})
+    first = client.get('/products?limit=5').get_json()
+    assert client.get('/products?limit=5').get_json() == first
+
+    client.post('/products/generate', json={'count': 5, 'seed': 2})
+    assert client.get('/products?limit=5').get_json()['total'] == 15
+    # Two generates so far, so entries are keyed under catalog version 2
+    assert app.cache.get('v2:/products?limit=5') is not None
+
+    assert client.get('/products?page=0').status_code == 400
+    assert app.cache.get('v2:/products?page=0') is None
+
+
+def test_search_falls_back_to_substring_matches(client):
+    client.post('/products/generate', json={'count': 60, 'seed': 11})
+    items = _fetch_all_products(client, limit=60)
+
+    # 'mbrell' sits inside 'Umbrella', so no word starts with it
+    data = client.get('/products/search?q=mbrell&limit=60').get_json()
+    expected = [it['id'] for it in items if any(
+        'mbrell' in it[field].lower() for field in ('name', 'brand', 'category', 'sku')
+    )]
+    assert expected
+    assert data['total'] == len(expected)
+    assert [it['id'] for it in data['items']] == expected
+
+    assert client.get('/products/search?q=zzq').get_json()['total'] == 0
+
+
+def test_snapshot_and_database_paths_agree(client, app):
+    client.post('/products/generate', json={'count': 150, 'seed': 8})
+    urls = [
+        '/products?limit=40&page=2',
+        '/products?limit=150',
+        '/products/search?q=acm&limit=30&page=2',
+        '/products/search?q=smart%20lamp&limit=200',
+        '/products/search?q=mbrell&limit=10',
+    ]
+    from_snapshot = [client.get(url).get_json() for url in urls]
+
+    app.config['CATALOG_SNAPSHOT_MAX'] = 0
+    app.cache.clear()
+    from_database = [client.get(url).get_json() for url in urls]
+    assert from_database == from_snapshot
+
+
+@pytest.mark.parametrize('snapshot_max', [0, None], ids=['database', 'snapshot'])
+def test_reads_see_writes_from_other_app_instances(tmp_path, snapshot_max):
+    db_uri = f"sqlite:///{tmp_path/'shared.db'}"
+    writer = create_app(database_uri=db_uri)
+    reader = create_app(database_uri=db_uri)
+    if snapshot_max is not None:
+        reader.config['CATALOG_SNAPSHOT_MAX'] = snapshot_max
+    writer_client, reader_client = writer.test_client(), reader.test_client()
+
+    for expected in (10, 20):
+        writer_client.post('/products/generate', json={'count': 10})
+        page = reader_client.get('/products?limit=50').get_json()
+        assert page['total'] == expected
+        assert len(page['items']) == expected
+        assert reader_client.get('/products/search?q=sku').get_json()['total'] == expected
+        assert reader_client.get('/products/search?q=SKU').get_json()['total'] == expected
+
+
+def test_substring_search_above_index_limit_uses_like(client, app):
+    app.config['CATALOG_SNAPSHOT_MAX'] = 10
+    client.post('/products/generate', json={'count': 40, 'seed': 11})
+    items = _fetch_all_products(client, limit=50)
+
+    data = client.get('/products/search?q=mbrell&limit=5&page=2').get_json()
+    expected = [it['id'] for it in items if any(
+        'mbrell' in it[field].lower() for field in ('name', 'brand', 'category', 'sku')
+    )]
+    assert data['total'] == len(expected)
+    assert [it['id'] for it in data['items']] == expected[5:10]
+
+    assert client.get('/products/search?q=zzq').get_json()['total'] == 0
+
+
+def test_index_page_is_prerendered(client, app):
+    with app.app_context():
+        expected = render_template('index.html').encode('utf-8')
+
+    res = client.get('/')
+    assert res.status_code == 200
+    assert res.mimetype == 'text/html'
+    assert res.headers['Cache-Control'] == 'public, max-age=300'
+    assert res.data == expected
+
+    # Debug mode renders per request and skips the shared-cache header
+    app.debug = True
+    res = client.get('/')
+    assert res.status_code == 200
+    assert res.mimetype == 'text/html'
+    assert 'Cache-Control' not in res.headers
+    assert res.data == expected